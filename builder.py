@@ -14,8 +14,10 @@ Real-world examples:
 - Configuration objects
 """
 
+import functools
+import sys
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from enum import Enum
 
 
@@ -26,6 +28,10 @@ class Direction(Enum):
     EAST = "EAST"
     WEST = "WEST"
 
+    def __init__(self, value: str):
+        # Plain attribute copy of .value, cheaper to read than the descriptor
+        self._label = value
+
 
 class SequenceMode(Enum):
     """Sequence operation modes."""
@@ -34,19 +40,44 @@ class SequenceMode(Enum):
     NIGHT = "NIGHT"
     EMERGENCY = "EMERGENCY"
 
+    def __init__(self, value: str):
+        self._label = value
+
+
+class _FrozenSlots:
+    """
+    Copy and pickle support for frozen dataclasses with hand-written
+    __slots__: the default state restore assigns attributes, which the
+    frozen __setattr__ refuses, so restore through object.__setattr__.
+    """
+    __slots__ = ()
 
-@dataclass
-class LightTiming:
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+@dataclass(frozen=True)
+class LightTiming(_FrozenSlots):
     """Timing configuration for a single light state."""
+    __slots__ = ("green_duration", "yellow_duration", "red_duration")
+
     green_duration: int
     yellow_duration: int
     red_duration: int
 
 
-@dataclass
-class TrafficSequence:
+@dataclass(frozen=True)
+class TrafficSequence(_FrozenSlots):
     """Complete traffic light sequence configuration."""
-    directions: List[Direction]
+    __slots__ = ("directions", "timing", "mode", "pedestrian_enabled",
+                 "pedestrian_duration", "emergency_override",
+                 "sensor_enabled", "log_events", "_directions_str")
+
+    directions: Tuple[Direction, ...]
     timing: LightTiming
     mode: SequenceMode
     pedestrian_enabled: bool
@@ -55,22 +86,65 @@ class TrafficSequence:
     sensor_enabled: bool
     log_events: bool
 
-    def display(self):
-        """Display sequence configuration."""
-        print(f"🚦 Traffic Sequence Configuration")
-        print(f"   Directions: {', '.join(d.value for d in self.directions)}")
-        print(f"   Mode: {self.mode.value}")
-        print(f"   Green: {self.timing.green_duration}s, "
-              f"Yellow: {self.timing.yellow_duration}s, "
-              f"Red: {self.timing.red_duration}s")
-        print(f"   Pedestrian: {'Enabled' if self.pedestrian_enabled else 'Disabled'}", end="")
-        if self.pedestrian_enabled:
-            print(f" ({self.pedestrian_duration}s)")
-        else:
-            print()
-        print(f"   Emergency Override: {'Yes' if self.emergency_override else 'No'}")
-        print(f"   Sensor Enabled: {'Yes' if self.sensor_enabled else 'No'}")
-        print(f"   Event Logging: {'Yes' if self.log_events else 'No'}")
+    def __post_init__(self):
+        # Frozen, so stash the derived string through object.__setattr__
+        object.__setattr__(self, "_directions_str",
+                           ", ".join(d._label for d in self.directions))
+
+    @property
+    def directions_str(self) -> str:
+        """Comma-separated direction names, computed once at construction."""
+        return self._directions_str
+
+    def display(self, verbose: bool = True):
+        """
+        Display sequence configuration.
+
+        Args:
+            verbose: When False, skip formatting and output entirely.
+        """
+        if not verbose:
+            return
+        pedestrian = (f"Enabled ({self.pedestrian_duration}s)"
+                      if self.pedestrian_enabled else "Disabled")
+        sys.stdout.write(
+            f"🚦 Traffic Sequence Configuration\n"
+            f"   Directions: {self._directions_str}\n"
+            f"   Mode: {self.mode._label}\n"
+            f"   Green: {self.timing.green_duration}s, "
+            f"Yellow: {self.timing.yellow_duration}s, "
+            f"Red: {self.timing.red_duration}s\n"
+            f"   Pedestrian: {pedestrian}\n"
+            f"   Emergency Override: {'Yes' if self.emergency_override else 'No'}\n"
+            f"   Sensor Enabled: {'Yes' if self.sensor_enabled else 'No'}\n"
+            f"   Event Logging: {'Yes' if self.log_events else 'No'}\n"
+        )
+        sys.stdout.flush()
+
+
+# Green-duration adjustment applied by in_mode():
+# ("max", n) raises green to at least n, ("set", n) replaces it.
+_MODE_GREEN_OVERRIDES: Dict[SequenceMode, Tuple[str, int]] = {
+    SequenceMode.RUSH_HOUR: ("max", 90),
+    SequenceMode.NIGHT: ("set", 30),
+    SequenceMode.EMERGENCY: ("set", 120),
+}
+
+
+def _compute_red(n_directions: int, green: int, yellow: int) -> int:
+    """
+    Red duration for one direction: it waits while every other direction
+    runs its green and yellow phases.
+    (simplified - in real system would consider all directions)
+    """
+    return (n_directions - 1) * (green + yellow)
+
+
+@functools.lru_cache(maxsize=1024)
+def _make_timing(green: int, yellow: int, red: int) -> LightTiming:
+    """Return a shared LightTiming for these durations (safe: it is frozen)."""
+    return LightTiming(green_duration=green, yellow_duration=yellow,
+                       red_duration=red)
 
 
 class TrafficSequenceBuilder:
@@ -84,8 +158,17 @@ class TrafficSequenceBuilder:
     - Easy to extend with new options
     """
 
+    __slots__ = ("_directions", "_green_duration", "_yellow_duration",
+                 "_red_duration", "_mode", "_pedestrian_enabled",
+                 "_pedestrian_duration", "_emergency_override",
+                 "_sensor_enabled", "_log_events")
+
     def __init__(self):
         """Initialize with default values."""
+        self._reset_defaults()
+
+    def _reset_defaults(self) -> None:
+        """Assign the default value of every builder option."""
         self._directions: List[Direction] = []
         self._green_duration: int = 60
         self._yellow_duration: int = 5
@@ -112,12 +195,13 @@ class TrafficSequenceBuilder:
         """Set operation mode."""
         self._mode = mode
         # Adjust timing based on mode
-        if mode == SequenceMode.RUSH_HOUR:
-            self._green_duration = max(90, self._green_duration)
-        elif mode == SequenceMode.NIGHT:
-            self._green_duration = 30
-        elif mode == SequenceMode.EMERGENCY:
-            self._green_duration = 120
+        override = _MODE_GREEN_OVERRIDES.get(mode)
+        if override:
+            op, green = override
+            if op == "max":
+                self._green_duration = max(green, self._green_duration)
+            else:
+                self._green_duration = green
         return self
 
     def enable_pedestrian(self, duration: int = 30) -> 'TrafficSequenceBuilder':
@@ -156,19 +240,16 @@ class TrafficSequenceBuilder:
             raise ValueError("Green duration must be positive")
 
         # Calculate red duration based on other lights
-        # (simplified - in real system would consider all directions)
-        self._red_duration = (len(self._directions) - 1) * (
-            self._green_duration + self._yellow_duration
+        self._red_duration = _compute_red(
+            len(self._directions), self._green_duration, self._yellow_duration
         )
 
-        timing = LightTiming(
-            green_duration=self._green_duration,
-            yellow_duration=self._yellow_duration,
-            red_duration=self._red_duration
+        timing = _make_timing(
+            self._green_duration, self._yellow_duration, self._red_duration
         )
 
         return TrafficSequence(
-            directions=self._directions,
+            directions=tuple(self._directions),
             timing=timing,
             mode=self._mode,
             pedestrian_enabled=self._pedestrian_enabled,
@@ -178,9 +259,44 @@ class TrafficSequenceBuilder:
             log_events=self._log_events
         )
 
+    def build_batch(self, timings: Iterable[Tuple[int, int]]) -> List[TrafficSequence]:
+        """
+        Build one sequence per (green, yellow) pair, sharing every other
+        option configured on this builder.
+
+        Useful for sweeping candidate timings without re-running the
+        fluent chain per candidate. Identical timings share one
+        LightTiming instance.
+
+        Raises:
+            ValueError: If no direction is set or any green duration
+                is not positive.
+        """
+        if not self._directions:
+            raise ValueError("At least one direction must be specified")
+
+        directions = tuple(self._directions)
+        n_directions = len(directions)
+        sequences = []
+        for green, yellow in timings:
+            if green <= 0:
+                raise ValueError("Green duration must be positive")
+            red = _compute_red(n_directions, green, yellow)
+            sequences.append(TrafficSequence(
+                directions=directions,
+                timing=_make_timing(green, yellow, red),
+                mode=self._mode,
+                pedestrian_enabled=self._pedestrian_enabled,
+                pedestrian_duration=self._pedestrian_duration,
+                emergency_override=self._emergency_override,
+                sensor_enabled=self._sensor_enabled,
+                log_events=self._log_events
+            ))
+        return sequences
+
     def reset(self) -> 'TrafficSequenceBuilder':
         """Reset builder to default state."""
-        self.__init__()
+        self._reset_defaults()
         return self
 
 
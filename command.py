@@ -5,21 +5,26 @@ Command Design Pattern
 Intent: Encapsulate a request as an object, allowing parameterization and queuing.
 """
 
-from abc import ABC, abstractmethod
-from typing import List
+import logging
+import sys
+from collections import deque
+from typing import Deque, Optional, Protocol
 
 
-class Command(ABC):
-    @abstractmethod
+_log = logging.getLogger(__name__)
+
+
+class Command(Protocol):
     def execute(self) -> None:
-        pass
+        ...
 
-    @abstractmethod
     def undo(self) -> None:
-        pass
+        ...
+
 
+class ChangeToGreenCommand:
+    __slots__ = ("light", "previous_state")
 
-class ChangeToGreenCommand(Command):
     def __init__(self, light: 'TrafficLight'):
         self.light = light
         self.previous_state = None
@@ -27,21 +32,27 @@ class ChangeToGreenCommand(Command):
     def execute(self) -> None:
         self.previous_state = self.light.state
         self.light.state = "GREEN"
-        print(f"   Changed to GREEN")
+        _log.debug("Changed to GREEN")
 
     def undo(self) -> None:
         self.light.state = self.previous_state
-        print(f"   Undid: Restored to {self.previous_state}")
+        _log.debug("Undid: Restored to %s", self.previous_state)
 
 
 class TrafficLight:
+    __slots__ = ("state",)
+
     def __init__(self):
         self.state = "RED"
 
 
 class TrafficController:
-    def __init__(self):
-        self.history: List[Command] = []
+    __slots__ = ("history",)
+
+    def __init__(self, max_history: Optional[int] = 1024):
+        # Oldest commands drop off once max_history is reached;
+        # pass None for unbounded undo.
+        self.history: Deque[Command] = deque(maxlen=max_history)
 
     def execute_command(self, command: Command):
         command.execute()
@@ -74,4 +85,6 @@ def demonstrate_command():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="   %(message)s",
+                        stream=sys.stdout)
     demonstrate_command()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Add examples to path once for the whole session
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'examples'))
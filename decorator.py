@@ -5,43 +5,55 @@ Decorator Design
 Intent: Attach additional responsibilities to an object dynamically.
 """
 
-from abc import ABC, abstractmethod
+import logging
+import sys
+from typing import ClassVar, FrozenSet, Protocol
 
 
-class TrafficLightComponent(ABC):
-    @abstractmethod
+_log = logging.getLogger(__name__)
+
+
+class TrafficLightComponent(Protocol):
     def change_state(self, state: str) -> None:
-        pass
+        ...
+
 
+class BasicTrafficLight:
+    __slots__ = ("state",)
 
-class BasicTrafficLight(TrafficLightComponent):
     def __init__(self):
         self.state = "RED"
 
     def change_state(self, state: str) -> None:
         self.state = state
-        print(f"   Light changed to: {state}")
+        _log.debug("Light changed to: %s", state)
 
 
-class LoggingDecorator(TrafficLightComponent):
+class LoggingDecorator:
+    __slots__ = ("_component",)
+
     def __init__(self, component: TrafficLightComponent):
         self._component = component
 
     def change_state(self, state: str) -> None:
-        print(f"   [LOG] Changing state to {state}")
+        _log.debug("[LOG] Changing state to %s", state)
         self._component.change_state(state)
-        print(f"   [LOG] State changed successfully")
+        _log.debug("[LOG] State changed successfully")
+
+
+class ValidationDecorator:
+    __slots__ = ("_component",)
 
+    _VALID_STATES: ClassVar[FrozenSet[str]] = frozenset({"RED", "YELLOW", "GREEN"})
 
-class ValidationDecorator(TrafficLightComponent):
     def __init__(self, component: TrafficLightComponent):
         self._component = component
 
     def change_state(self, state: str) -> None:
-        if state not in ["RED", "YELLOW", "GREEN"]:
-            print(f"   [VALIDATION] Invalid state: {state}")
+        if state not in self._VALID_STATES:
+            _log.debug("[VALIDATION] Invalid state: %s", state)
             return
-        print(f"   [VALIDATION] State {state} is valid")
+        _log.debug("[VALIDATION] State %s is valid", state)
         self._component.change_state(state)
 
 
@@ -67,4 +79,6 @@ def demonstrate_decorator():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="   %(message)s",
+                        stream=sys.stdout)
     demonstrate_decorator()
@@ -13,9 +13,9 @@ Real-world examples:
 - UI components (Button, TextField, Checkbox)
 """
 
-from abc import ABC, abstractmethod
-from enum import Enum
-from typing import Dict
+from enum import Enum, IntEnum
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Sequence
 
 
 class LightColor(Enum):
@@ -24,70 +24,116 @@ class LightColor(Enum):
     YELLOW = "YELLOW"
     GREEN = "GREEN"
 
+    def __init__(self, value: str):
+        # Plain attribute copy of .value, cheaper to read than the descriptor
+        self._label = value
 
-class TrafficLight(ABC):
-    """Abstract traffic light interface."""
+
+# Light type name -> class, filled in as TrafficLight subclasses are defined
+_LIGHT_REGISTRY: Dict[str, type] = {}
+
+
+class TrafficLight:
+    """
+    Base traffic light; subclasses implement get_duration and get_sequence.
+
+    Subclasses passing ``light_name`` are registered with the factory:
+        class VehicleLight(TrafficLight, light_name="vehicle"): ...
+    """
+
+    __slots__ = ("direction", "color")
+
+    def __init_subclass__(cls, light_name: Optional[str] = None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if light_name:
+            _LIGHT_REGISTRY[light_name.lower()] = cls
 
     def __init__(self, direction: str):
         self.direction = direction
         self.color = LightColor.RED
 
-    @abstractmethod
     def get_duration(self) -> int:
         """Return duration in seconds for this light type."""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
-    def get_sequence(self) -> list[LightColor]:
+    def get_sequence(self) -> Sequence[LightColor]:
         """Return the sequence of colors for this light."""
-        pass
+        raise NotImplementedError
 
     def display_info(self):
         """Display light information."""
         print(f"  Direction: {self.direction}")
-        print(f"  Current color: {self.color.value}")
+        print(f"  Current color: {self.color._label}")
         print(f"  Duration: {self.get_duration()}s")
-        print(f"  Sequence: {' → '.join(c.value for c in self.get_sequence())}")
+        print(f"  Sequence: {' → '.join(c._label for c in self.get_sequence())}")
 
 
-class VehicleLight(TrafficLight):
+class VehicleLight(TrafficLight, light_name="vehicle"):
     """Standard vehicle traffic light."""
 
+    __slots__ = ()
+
+    _SEQUENCE = (LightColor.GREEN, LightColor.YELLOW, LightColor.RED)
+
     def get_duration(self) -> int:
         return 60  # 60 seconds green
 
-    def get_sequence(self) -> list[LightColor]:
-        return [LightColor.GREEN, LightColor.YELLOW, LightColor.RED]
+    def get_sequence(self) -> Sequence[LightColor]:
+        return self._SEQUENCE
 
 
-class PedestrianLight(TrafficLight):
+class PedestrianLight(TrafficLight, light_name="pedestrian"):
     """Pedestrian crossing light."""
 
+    __slots__ = ()
+
+    _SEQUENCE = (LightColor.GREEN, LightColor.RED)  # No yellow for pedestrians
+
     def get_duration(self) -> int:
         return 30  # 30 seconds to cross
 
-    def get_sequence(self) -> list[LightColor]:
-        return [LightColor.GREEN, LightColor.RED]  # No yellow for pedestrians
+    def get_sequence(self) -> Sequence[LightColor]:
+        return self._SEQUENCE
 
 
-class EmergencyLight(TrafficLight):
+class EmergencyLight(TrafficLight, light_name="emergency"):
     """Emergency vehicle priority light."""
 
+    __slots__ = ()
+
+    _SEQUENCE = (LightColor.GREEN,)  # Always green for emergency
+
     def get_duration(self) -> int:
         return 120  # 2 minutes for emergency vehicles
 
-    def get_sequence(self) -> list[LightColor]:
-        return [LightColor.GREEN]  # Always green for emergency
+    def get_sequence(self) -> Sequence[LightColor]:
+        return self._SEQUENCE
 
 
-class ArrowLight(TrafficLight):
+class ArrowLight(TrafficLight, light_name="arrow"):
     """Turn arrow light."""
 
+    __slots__ = ()
+
+    _SEQUENCE = (LightColor.GREEN, LightColor.YELLOW, LightColor.RED)
+
     def get_duration(self) -> int:
         return 20  # 20 seconds for turn
 
-    def get_sequence(self) -> list[LightColor]:
-        return [LightColor.GREEN, LightColor.YELLOW, LightColor.RED]
+    def get_sequence(self) -> Sequence[LightColor]:
+        return self._SEQUENCE
+
+
+class LightTypeID(IntEnum):
+    """Built-in light types, usable as direct indices into the factory."""
+    VEHICLE = 0
+    PEDESTRIAN = 1
+    EMERGENCY = 2
+    ARROW = 3
+
+
+# Indexed by LightTypeID
+_LIGHT_CLASSES = (VehicleLight, PedestrianLight, EmergencyLight, ArrowLight)
 
 
 class TrafficLightFactory:
@@ -100,12 +146,8 @@ class TrafficLightFactory:
     - Ensure consistent light creation
     """
 
-    _light_types: Dict[str, type] = {
-        "vehicle": VehicleLight,
-        "pedestrian": PedestrianLight,
-        "emergency": EmergencyLight,
-        "arrow": ArrowLight,
-    }
+    # Read-only view; register_light_type() writes to the underlying dict
+    _light_types: Mapping[str, type] = MappingProxyType(_LIGHT_REGISTRY)
 
     @classmethod
     def create_light(cls, light_type: str, direction: str) -> TrafficLight:
@@ -130,10 +172,20 @@ class TrafficLightFactory:
             )
         return light_class(direction)
 
+    @staticmethod
+    def create_light_by_id(type_id: LightTypeID, direction: str) -> TrafficLight:
+        """
+        Create a built-in traffic light by its LightTypeID.
+
+        Fast path for internal callers: a tuple index with no string
+        normalization or dict lookup.
+        """
+        return _LIGHT_CLASSES[type_id](direction)
+
     @classmethod
     def register_light_type(cls, name: str, light_class: type):
         """Register a new light type (extension point)."""
-        cls._light_types[name.lower()] = light_class
+        _LIGHT_REGISTRY[name.lower()] = light_class
 
     @classmethod
     def get_supported_types(cls) -> list[str]:
@@ -13,43 +13,32 @@ Real-world examples:
 - Thread pools
 """
 
+import logging
+import sys
 import threading
 from typing import Optional
 
 
+_log = logging.getLogger(__name__)
+
+
 class TrafficLightController:
     """
-    Thread-safe Singleton implementation using double-checked locking.
+    Singleton traffic light controller, one per intersection.
 
-    This ensures only one controller instance exists per intersection,
-    preventing conflicts from multiple controller instances.
+    The single instance is created on first use and handed out by
+    ``get_controller()``; once it exists, callers never take a lock.
     """
 
-    _instance: Optional['TrafficLightController'] = None
-    _lock: threading.Lock = threading.Lock()
-
-    def __new__(cls):
-        """
-        Create or return the single instance.
-        Uses double-checked locking for thread safety with minimal overhead.
-        """
-        if cls._instance is None:
-            with cls._lock:
-                # Double-check: another thread might have created instance
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
-
-    def __init__(self):
-        """Initialize the controller only once."""
-        if self._initialized:
-            return
+    def __init__(self) -> None:
+        raise TypeError(
+            "TrafficLightController is a singleton; use get_controller()"
+        )
 
+    def _initialize(self) -> None:
+        """Set up controller state (called exactly once per instance)."""
         self.intersection_id = "MAIN_INTERSECTION"
         self.current_state = "RED"
-        self._initialized = True
-        print(f"✅ Traffic Light Controller created for {self.intersection_id}")
 
     def get_state(self) -> str:
         """Return current traffic light state."""
@@ -57,14 +46,43 @@ class TrafficLightController:
 
     def change_state(self, new_state: str) -> None:
         """Change traffic light state."""
-        print(f"🚦 State changing: {self.current_state} → {new_state}")
+        _log.debug("🚦 State changing: %s → %s", self.current_state, new_state)
         self.current_state = new_state
 
-    @classmethod
-    def reset(cls):
-        """Reset singleton (useful for testing)."""
-        with cls._lock:
-            cls._instance = None
+
+def _create_controller() -> TrafficLightController:
+    # Bypass __init__, which only exists to refuse direct construction
+    controller = TrafficLightController.__new__(TrafficLightController)
+    controller._initialize()
+    return controller
+
+
+_controller: Optional[TrafficLightController] = None
+_controller_lock = threading.Lock()
+
+
+def get_controller() -> TrafficLightController:
+    """
+    Return the single controller instance, creating it on first call.
+
+    Uses double-checked locking: the lock is only taken while no instance
+    exists, and the instance is published only after it is initialized.
+    """
+    global _controller
+    controller = _controller
+    if controller is not None:  # Fast path, no lock
+        return controller
+    with _controller_lock:
+        if _controller is None:
+            _controller = _create_controller()
+        return _controller
+
+
+def reset_controller() -> None:
+    """Drop the singleton so the next call creates a fresh one (testing)."""
+    global _controller
+    with _controller_lock:
+        _controller = None
 
 
 def demonstrate_singleton():
@@ -75,7 +93,8 @@ def demonstrate_singleton():
 
     # Create first instance
     print("\n1. Creating first controller instance...")
-    controller1 = TrafficLightController()
+    controller1 = get_controller()
+    print(f"   ✅ Traffic Light Controller for {controller1.intersection_id}")
     print(f"   Instance ID: {id(controller1)}")
     print(f"   Current state: {controller1.get_state()}")
 
@@ -85,7 +104,7 @@ def demonstrate_singleton():
 
     # Try to create second instance
     print("\n3. Creating 'second' controller instance...")
-    controller2 = TrafficLightController()
+    controller2 = get_controller()
     print(f"   Instance ID: {id(controller2)}")
     print(f"   Current state: {controller2.get_state()}")
 
@@ -99,7 +118,7 @@ def demonstrate_singleton():
     instances = []
 
     def create_instance():
-        instances.append(TrafficLightController())
+        instances.append(get_controller())
 
     threads = [threading.Thread(target=create_instance) for _ in range(10)]
     for t in threads:
@@ -114,4 +133,6 @@ def demonstrate_singleton():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s",
+                        stream=sys.stdout)
     demonstrate_singleton()
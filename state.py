@@ -5,36 +5,55 @@ State Design Pattern
 Intent: Allow an object to alter its behavior when its internal state changes.
 """
 
-from abc import ABC, abstractmethod
+import logging
+import sys
+from typing import Protocol
 
 
-class TrafficLightState(ABC):
-    @abstractmethod
+_log = logging.getLogger(__name__)
+
+
+class TrafficLightState(Protocol):
     def handle(self, context: 'TrafficLight') -> None:
-        pass
+        ...
 
 
-class RedState(TrafficLightState):
+class RedState:
+    __slots__ = ()
+
     def handle(self, context: 'TrafficLight') -> None:
-        print("🔴 RED - Stop!")
-        context.state = GreenState()
+        _log.debug("🔴 RED - Stop!")
+        context.state = GREEN
+
 
+class YellowState:
+    __slots__ = ()
 
-class YellowState(TrafficLightState):
     def handle(self, context: 'TrafficLight') -> None:
-        print("🟡 YELLOW - Prepare to stop")
-        context.state = RedState()
+        _log.debug("🟡 YELLOW - Prepare to stop")
+        context.state = RED
 
 
-class GreenState(TrafficLightState):
+class GreenState:
+    __slots__ = ()
+
     def handle(self, context: 'TrafficLight') -> None:
-        print("🟢 GREEN - Go!")
-        context.state = YellowState()
+        _log.debug("🟢 GREEN - Go!")
+        context.state = YELLOW
+
+
+# States carry no data, so one shared instance of each is enough and
+# transitions never allocate.
+RED = RedState()
+YELLOW = YellowState()
+GREEN = GreenState()
 
 
 class TrafficLight:
+    __slots__ = ("state",)
+
     def __init__(self):
-        self.state = RedState()
+        self.state: TrafficLightState = RED
 
     def change(self):
         self.state.handle(self)
@@ -52,4 +71,6 @@ def demonstrate_state():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s",
+                        stream=sys.stdout)
     demonstrate_state()
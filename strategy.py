@@ -8,92 +8,146 @@ interchangeable. Strategy lets the algorithm vary independently from clients.
 Use Case: Different traffic light sequencing algorithms (fixed, adaptive, emergency).
 """
 
-from abc import ABC, abstractmethod
-from typing import List
+import logging
+import sys
+from typing import Final, Protocol, Sequence, Tuple
 from enum import Enum
 
 
+_log = logging.getLogger(__name__)
+
+
 class LightState(Enum):
     RED = "RED"
     YELLOW = "YELLOW"
     GREEN = "GREEN"
 
+    def __init__(self, value: str):
+        # Plain attribute copies, cheaper to read than .value; _idx is the
+        # member's position and indexes the duration tables below
+        self._label = value
+        self._idx = len(type(self)._member_names_)
+
+Plan = Tuple[Tuple[LightState, int], ...]
+
+
+def _make_plan(sequence: Sequence[LightState], durations: Sequence[int]) -> Plan:
+    """Pair each state in the sequence with its duration."""
+    return tuple((state, durations[state._idx]) for state in sequence)
 
-class SequencingStrategy(ABC):
-    """Abstract strategy for traffic light sequencing."""
 
-    @abstractmethod
-    def get_sequence(self) -> List[LightState]:
+class SequencingStrategy(Protocol):
+    """
+    Strategy interface for traffic light sequencing.
+
+    Strategies may also expose a ``plan`` attribute holding one cycle as
+    precomputed (state, duration) pairs; the context walks it directly
+    when present and falls back to get_sequence()/get_duration().
+    """
+
+    def get_sequence(self) -> Sequence[LightState]:
         """Return the sequence of light states."""
-        pass
+        ...
 
-    @abstractmethod
     def get_duration(self, state: LightState) -> int:
         """Return duration for given state."""
-        pass
+        ...
 
 
-class FixedTimeStrategy(SequencingStrategy):
+class FixedTimeStrategy:
     """Fixed-time sequencing (traditional traffic lights)."""
 
-    def get_sequence(self) -> List[LightState]:
-        return [LightState.GREEN, LightState.YELLOW, LightState.RED]
+    __slots__ = ()
+
+    _SEQUENCE = (LightState.GREEN, LightState.YELLOW, LightState.RED)
+    # Indexed by LightState._idx: (RED, YELLOW, GREEN)
+    _DURATIONS: Final = (65, 5, 60)
+    plan: Final = _make_plan(_SEQUENCE, _DURATIONS)
+
+    def get_sequence(self) -> Sequence[LightState]:
+        return self._SEQUENCE
 
     def get_duration(self, state: LightState) -> int:
-        durations = {
-            LightState.GREEN: 60,
-            LightState.YELLOW: 5,
-            LightState.RED: 65
-        }
-        return durations[state]
+        return self._DURATIONS[state._idx]
 
 
-class AdaptiveStrategy(SequencingStrategy):
+class AdaptiveStrategy:
     """Adaptive sequencing based on traffic sensors."""
 
+    __slots__ = ("_traffic_level", "_durations", "_plan")
+
+    _SEQUENCE = (LightState.GREEN, LightState.YELLOW, LightState.RED)
+    # Indexed by LightState._idx: (RED, YELLOW, GREEN)
+    _TABLES: Final = {
+        "heavy": (45, 5, 90),
+        "light": (30, 3, 30),
+        "medium": (60, 5, 60),
+    }
+
     def __init__(self, traffic_level: str = "medium"):
         self.traffic_level = traffic_level
 
-    def get_sequence(self) -> List[LightState]:
-        return [LightState.GREEN, LightState.YELLOW, LightState.RED]
+    @property
+    def traffic_level(self) -> str:
+        return self._traffic_level
+
+    @traffic_level.setter
+    def traffic_level(self, level: str) -> None:
+        self._traffic_level = level
+        # Unknown levels fall back to medium
+        self._durations = self._TABLES.get(level, self._TABLES["medium"])
+        self._plan = _make_plan(self._SEQUENCE, self._durations)
+
+    @property
+    def plan(self) -> Plan:
+        return self._plan
+
+    def get_sequence(self) -> Sequence[LightState]:
+        return self._SEQUENCE
 
     def get_duration(self, state: LightState) -> int:
-        if self.traffic_level == "heavy":
-            durations = {LightState.GREEN: 90, LightState.YELLOW: 5, LightState.RED: 45}
-        elif self.traffic_level == "light":
-            durations = {LightState.GREEN: 30, LightState.YELLOW: 3, LightState.RED: 30}
-        else:  # medium
-            durations = {LightState.GREEN: 60, LightState.YELLOW: 5, LightState.RED: 60}
-        return durations[state]
+        return self._durations[state._idx]
 
 
-class EmergencyStrategy(SequencingStrategy):
+class EmergencyStrategy:
     """Emergency mode - keep green for emergency vehicles."""
 
-    def get_sequence(self) -> List[LightState]:
-        return [LightState.GREEN]  # Stay green
+    __slots__ = ()
+
+    _SEQUENCE = (LightState.GREEN,)  # Stay green
+    _DURATION = 999999  # Indefinite
+    plan: Final = ((LightState.GREEN, _DURATION),)
+
+    def get_sequence(self) -> Sequence[LightState]:
+        return self._SEQUENCE
 
     def get_duration(self, state: LightState) -> int:
-        return 999999  # Indefinite
+        return self._DURATION
 
 
 class TrafficLightContext:
     """Context that uses a sequencing strategy."""
 
+    __slots__ = ("_strategy",)
+
     def __init__(self, strategy: SequencingStrategy):
         self._strategy = strategy
 
     def set_strategy(self, strategy: SequencingStrategy):
         """Change strategy at runtime."""
-        print(f"   Switching to: {strategy.__class__.__name__}")
+        _log.debug("Switching to: %s", strategy.__class__.__name__)
         self._strategy = strategy
 
     def execute_cycle(self):
         """Execute one complete light cycle."""
-        print(f"   Executing {self._strategy.__class__.__name__}:")
-        for state in self._strategy.get_sequence():
-            duration = self._strategy.get_duration(state)
-            print(f"      {state.value}: {duration}s")
+        strategy = self._strategy
+        _log.debug("Executing %s:", strategy.__class__.__name__)
+        plan = getattr(strategy, "plan", None)
+        if plan is None:
+            plan = [(state, strategy.get_duration(state))
+                    for state in strategy.get_sequence()]
+        for state, duration in plan:
+            _log.debug("   %s: %ss", state._label, duration)
 
 
 def demonstrate_strategy():
@@ -117,4 +171,6 @@ def demonstrate_strategy():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="   %(message)s",
+                        stream=sys.stdout)
     demonstrate_strategy()
@@ -0,0 +1,76 @@
+import copy
+import pickle
+
+import pytest
+
+from builder import Direction, SequenceMode, TrafficSequenceBuilder
+
+
+@pytest.fixture
+def sequence():
+    return (TrafficSequenceBuilder()
+            .for_directions(Direction.NORTH, Direction.EAST)
+            .with_timing(green=45)
+            .enable_pedestrian()
+            .build())
+
+
+class TestEnums:
+    """Test the public enum API."""
+
+    def test_members_keep_string_values(self):
+        """Verify members look up and format by name, not by position."""
+        assert Direction("NORTH") is Direction.NORTH
+        assert Direction.NORTH.value == "NORTH"
+        assert Direction.NORTH._label == "NORTH"
+        assert Direction.NORTH != SequenceMode.NORMAL
+
+
+class TestTrafficSequence:
+    """Test the frozen, slotted sequence records."""
+
+    @pytest.mark.parametrize("round_trip", [
+        copy.copy,
+        copy.deepcopy,
+        lambda obj: pickle.loads(pickle.dumps(obj)),
+    ], ids=["copy", "deepcopy", "pickle"])
+    def test_copy_and_pickle_round_trip(self, sequence, round_trip):
+        """Verify frozen slotted dataclasses survive copy and pickle."""
+        clone = round_trip(sequence)
+
+        assert clone == sequence
+        assert clone.directions_str == "NORTH, EAST"
+        assert round_trip(sequence.timing) == sequence.timing
+
+    def test_display_quiet_writes_nothing(self, sequence, capsys):
+        """Verify display(verbose=False) skips output entirely."""
+        sequence.display(verbose=False)
+        assert capsys.readouterr().out == ""
+
+        sequence.display()
+        assert "Directions: NORTH, EAST" in capsys.readouterr().out
+
+
+class TestBuildBatch:
+    """Test TrafficSequenceBuilder.build_batch."""
+
+    def test_identical_rows_share_timing(self):
+        """Verify identical (green, yellow) rows share one LightTiming."""
+        builder = TrafficSequenceBuilder().for_directions(Direction.NORTH, Direction.SOUTH)
+        first, second, other = builder.build_batch([(40, 4), (40, 4), (50, 5)])
+
+        assert first.timing is second.timing
+        assert other.timing is not first.timing
+        assert (other.timing.green_duration, other.timing.red_duration) == (50, 55)
+        assert first == builder.with_timing(green=40, yellow=4).build()
+
+    def test_rejects_non_positive_green(self):
+        """Verify any non-positive green duration fails the whole batch."""
+        builder = TrafficSequenceBuilder().for_directions(Direction.NORTH)
+        with pytest.raises(ValueError):
+            builder.build_batch([(30, 5), (0, 5)])
+
+    def test_requires_directions(self):
+        """Verify a batch without directions is rejected."""
+        with pytest.raises(ValueError):
+            TrafficSequenceBuilder().build_batch([(30, 5)])
@@ -1,54 +1,68 @@
+import importlib
+
 import pytest
 from datetime import datetime
-import sys
-import os
-
-# Add examples to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'examples'))
-
-# Import pattern examples
-from design_patterns.creational.singleton import TrafficLightController as SingletonController
-from design_patterns.creational.factory import TrafficLightFactory, LightColor
-from design_patterns.behavioral.observer import (
-    TrafficLightSubject, MonitoringSystemObserver, DatabaseObserver
-)
-from design_patterns.behavioral.strategy import (
-    FixedTimeStrategy, AdaptiveStrategy, TrafficLightController as StrategyController,
-    TrafficData
-)
-from design_patterns.behavioral.state import TrafficLight, RedState, GreenState
-from design_patterns.behavioral.command import (
-    TrafficLightReceiver, ChangeToGreenCommand, TrafficLightInvoker
-)
+
+
+# Pattern modules are imported lazily, so running one test class only
+# imports the module it exercises. examples/ is put on sys.path by conftest.py.
+@pytest.fixture(scope="class")
+def singleton_mod():
+    return importlib.import_module("design_patterns.creational.singleton")
+
+
+@pytest.fixture(scope="class")
+def factory_mod():
+    return importlib.import_module("design_patterns.creational.factory")
+
+
+@pytest.fixture(scope="class")
+def observer_mod():
+    return importlib.import_module("design_patterns.behavioral.observer")
+
+
+@pytest.fixture(scope="class")
+def strategy_mod():
+    return importlib.import_module("design_patterns.behavioral.strategy")
+
+
+@pytest.fixture(scope="class")
+def state_mod():
+    return importlib.import_module("design_patterns.behavioral.state")
+
+
+@pytest.fixture(scope="class")
+def command_mod():
+    return importlib.import_module("design_patterns.behavioral.command")
 
 
 class TestSingletonPattern:
     """Test Singleton pattern implementation."""
 
-    def test_singleton_returns_same_instance(self):
+    def test_singleton_returns_same_instance(self, singleton_mod):
         """Verify only one instance is created."""
-        controller1 = SingletonController("Test-1")
-        controller2 = SingletonController("Test-2")
+        controller1 = singleton_mod.TrafficLightController("Test-1")
+        controller2 = singleton_mod.TrafficLightController("Test-2")
 
         assert controller1 is controller2
         assert id(controller1) == id(controller2)
 
-    def test_singleton_state_shared(self):
+    def test_singleton_state_shared(self, singleton_mod):
         """Verify state is shared across references."""
-        controller1 = SingletonController()
+        controller1 = singleton_mod.TrafficLightController()
         controller1.change_state("GREEN")
 
-        controller2 = SingletonController()
+        controller2 = singleton_mod.TrafficLightController()
         assert controller2.get_state() == "GREEN"
 
-    def test_singleton_thread_safe(self):
+    def test_singleton_thread_safe(self, singleton_mod):
         """Verify thread safety of singleton."""
         import threading
 
         instances = []
 
         def create_instance():
-            instances.append(SingletonController())
+            instances.append(singleton_mod.TrafficLightController())
 
         threads = [threading.Thread(target=create_instance) for _ in range(10)]
         for thread in threads:
@@ -63,27 +77,27 @@ class TestSingletonPattern:
 class TestFactoryPattern:
     """Test Factory pattern implementation."""
 
-    def test_factory_creates_vehicle_light(self):
+    def test_factory_creates_vehicle_light(self, factory_mod):
         """Test creation of vehicle light."""
-        factory = TrafficLightFactory()
+        factory = factory_mod.TrafficLightFactory()
         light = factory.create_light("VEHICLE", "NORTH")
 
         assert light.light_type == "VEHICLE"
         assert light.direction == "NORTH"
-        assert light.color == LightColor.RED
+        assert light.color == factory_mod.LightColor.RED
 
-    def test_factory_creates_pedestrian_light(self):
+    def test_factory_creates_pedestrian_light(self, factory_mod):
         """Test creation of pedestrian light."""
-        factory = TrafficLightFactory()
+        factory = factory_mod.TrafficLightFactory()
         light = factory.create_light("PEDESTRIAN", "EAST")
 
         assert light.light_type == "PEDESTRIAN"
         assert light.direction == "EAST"
         assert hasattr(light, 'has_audio')
 
-    def test_factory_raises_error_for_invalid_type(self):
+    def test_factory_raises_error_for_invalid_type(self, factory_mod):
         """Test factory raises error for invalid type."""
-        factory = TrafficLightFactory()
+        factory = factory_mod.TrafficLightFactory()
 
         with pytest.raises(ValueError, match="Unknown light type"):
             factory.create_light("INVALID", "NORTH")
@@ -92,10 +106,10 @@ class TestFactoryPattern:
 class TestObserverPattern:
     """Test Observer pattern implementation."""
 
-    def test_observer_receives_notifications(self):
+    def test_observer_receives_notifications(self, observer_mod):
         """Test observers are notified of state changes."""
-        subject = TrafficLightSubject("Test-Intersection")
-        database = DatabaseObserver()
+        subject = observer_mod.TrafficLightSubject("Test-Intersection")
+        database = observer_mod.DatabaseObserver()
 
         subject.attach(database)
         subject.change_state("GREEN", "NORTH")
@@ -105,11 +119,11 @@ class TestObserverPattern:
         assert history[0]['new_state'] == "GREEN"
         assert history[0]['direction'] == "NORTH"
 
-    def test_multiple_observers(self):
+    def test_multiple_observers(self, observer_mod):
         """Test multiple observers receive notifications."""
-        subject = TrafficLightSubject("Test-Intersection")
-        observer1 = DatabaseObserver()
-        observer2 = MonitoringSystemObserver("Test-Monitor")
+        subject = observer_mod.TrafficLightSubject("Test-Intersection")
+        observer1 = observer_mod.DatabaseObserver()
+        observer2 = observer_mod.MonitoringSystemObserver("Test-Monitor")
 
         subject.attach(observer1)
         subject.attach(observer2)
@@ -118,10 +132,10 @@ class TestObserverPattern:
 
         assert len(observer1.get_history()) == 1
 
-    def test_detached_observer_not_notified(self):
+    def test_detached_observer_not_notified(self, observer_mod):
         """Test detached observers don't receive notifications."""
-        subject = TrafficLightSubject("Test-Intersection")
-        observer = DatabaseObserver()
+        subject = observer_mod.TrafficLightSubject("Test-Intersection")
+        observer = observer_mod.DatabaseObserver()
 
         subject.attach(observer)
         subject.change_state("GREEN", "NORTH")
@@ -136,22 +150,22 @@ class TestObserverPattern:
 class TestStrategyPattern:
     """Test Strategy pattern implementation."""
 
-    def test_fixed_time_strategy(self):
+    def test_fixed_time_strategy(self, strategy_mod):
         """Test fixed time strategy."""
-        strategy = FixedTimeStrategy(green_duration=30)
-        traffic_data = [TrafficData("NORTH", 10, 20)]
+        strategy = strategy_mod.FixedTimeStrategy(green_duration=30)
+        traffic_data = [strategy_mod.TrafficData("NORTH", 10, 20)]
 
         sequence = strategy.calculate_sequence(traffic_data)
 
         assert len(sequence) == 1
         assert sequence[0] == ("NORTH", 30)
 
-    def test_adaptive_strategy_allocates_more_time_to_busy_direction(self):
+    def test_adaptive_strategy_allocates_more_time_to_busy_direction(self, strategy_mod):
         """Test adaptive strategy prioritizes busy directions."""
-        strategy = AdaptiveStrategy(min_duration=15, max_duration=60)
+        strategy = strategy_mod.AdaptiveStrategy(min_duration=15, max_duration=60)
         traffic_data = [
-            TrafficData("NORTH", 50, 60),  # Very busy
-            TrafficData("EAST", 5, 10)     # Not busy
+            strategy_mod.TrafficData("NORTH", 50, 60),  # Very busy
+            strategy_mod.TrafficData("EAST", 5, 10)     # Not busy
         ]
 
         sequence = strategy.calculate_sequence(traffic_data)
@@ -161,16 +175,16 @@ class TestStrategyPattern:
         # North should get more time
         assert north_duration > east_duration
 
-    def test_strategy_can_be_swapped_at_runtime(self):
+    def test_strategy_can_be_swapped_at_runtime(self, strategy_mod):
         """Test strategies can be changed dynamically."""
-        controller = StrategyController(FixedTimeStrategy(30))
-        traffic_data = [TrafficData("NORTH", 10, 20)]
+        controller = strategy_mod.TrafficLightController(strategy_mod.FixedTimeStrategy(30))
+        traffic_data = [strategy_mod.TrafficData("NORTH", 10, 20)]
 
         # Use fixed strategy
         sequence1 = controller._strategy.calculate_sequence(traffic_data)
 
         # Change to adaptive
-        controller.set_strategy(AdaptiveStrategy(15, 60))
+        controller.set_strategy(strategy_mod.AdaptiveStrategy(15, 60))
         sequence2 = controller._strategy.calculate_sequence(traffic_data)
 
         # Sequences should be different
@@ -180,15 +194,15 @@ class TestStrategyPattern:
 class TestStatePattern:
     """Test State pattern implementation."""
 
-    def test_initial_state_is_red(self):
+    def test_initial_state_is_red(self, state_mod):
         """Test traffic light starts in red state."""
-        light = TrafficLight("NORTH")
+        light = state_mod.TrafficLight("NORTH")
         assert light.get_color() == "RED"
         assert not light.can_cross()
 
-    def test_state_transitions(self):
+    def test_state_transitions(self, state_mod):
         """Test state transitions follow correct order."""
-        light = TrafficLight("NORTH")
+        light = state_mod.TrafficLight("NORTH")
 
         # RED → GREEN
         light.next()
@@ -205,17 +219,17 @@ class TestStatePattern:
         assert light.get_color() == "RED"
         assert not light.can_cross()
 
-    def test_night_mode(self):
+    def test_night_mode(self, state_mod):
         """Test night mode (flashing yellow)."""
-        light = TrafficLight("NORTH")
+        light = state_mod.TrafficLight("NORTH")
         light.enable_night_mode()
 
         assert light.get_color() == "FLASHING_YELLOW"
         assert light.can_cross()  # Can cross with caution
 
-    def test_state_history_logged(self):
+    def test_state_history_logged(self, state_mod):
         """Test state changes are logged."""
-        light = TrafficLight("NORTH")
+        light = state_mod.TrafficLight("NORTH")
         light.next()
         light.next()
 
@@ -226,10 +240,10 @@ class TestStatePattern:
 class TestCommandPattern:
     """Test Command pattern implementation."""
 
-    def test_command_execution(self):
+    def test_command_execution(self, command_mod):
         """Test command executes correctly."""
-        receiver = TrafficLightReceiver("Test")
-        command = ChangeToGreenCommand(receiver, "NORTH")
+        receiver = command_mod.TrafficLightReceiver("Test")
+        command = command_mod.ChangeToGreenCommand(receiver, "NORTH")
 
         command.execute()
 
@@ -237,10 +251,10 @@ class TestCommandPattern:
         assert state['state'] == "GREEN"
         assert state['direction'] == "NORTH"
 
-    def test_command_undo(self):
+    def test_command_undo(self, command_mod):
         """Test command can be undone."""
-        receiver = TrafficLightReceiver("Test")
-        command = ChangeToGreenCommand(receiver, "NORTH")
+        receiver = command_mod.TrafficLightReceiver("Test")
+        command = command_mod.ChangeToGreenCommand(receiver, "NORTH")
 
         # Execute
         command.execute()
@@ -250,13 +264,13 @@ class TestCommandPattern:
         command.undo()
         assert receiver.get_state()['state'] == "RED"
 
-    def test_invoker_maintains_history(self):
+    def test_invoker_maintains_history(self, command_mod):
         """Test invoker tracks command history."""
-        receiver = TrafficLightReceiver("Test")
-        invoker = TrafficLightInvoker()
+        receiver = command_mod.TrafficLightReceiver("Test")
+        invoker = command_mod.TrafficLightInvoker()
 
-        cmd1 = ChangeToGreenCommand(receiver, "NORTH")
-        cmd2 = ChangeToGreenCommand(receiver, "EAST")
+        cmd1 = command_mod.ChangeToGreenCommand(receiver, "NORTH")
+        cmd2 = command_mod.ChangeToGreenCommand(receiver, "EAST")
 
         invoker.execute_command(cmd1)
         invoker.execute_command(cmd2)
@@ -264,12 +278,12 @@ class TestCommandPattern:
         # History should have 2 commands
         assert len(invoker._history) == 2
 
-    def test_undo_redo(self):
+    def test_undo_redo(self, command_mod):
         """Test undo and redo functionality."""
-        receiver = TrafficLightReceiver("Test")
-        invoker = TrafficLightInvoker()
+        receiver = command_mod.TrafficLightReceiver("Test")
+        invoker = command_mod.TrafficLightInvoker()
 
-        command = ChangeToGreenCommand(receiver, "NORTH")
+        command = command_mod.ChangeToGreenCommand(receiver, "NORTH")
         invoker.execute_command(command)
 
         # Undo
@@ -283,8 +297,9 @@ class TestCommandPattern:
 
 # Pytest configuration and fixtures
 @pytest.fixture
-def sample_traffic_data():
+def sample_traffic_data(strategy_mod):
     """Fixture providing sample traffic data."""
+    TrafficData = strategy_mod.TrafficData
     return [
         TrafficData("NORTH", 25, 45),
         TrafficData("EAST", 10, 20),
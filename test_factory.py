@@ -0,0 +1,58 @@
+import pytest
+
+import factory
+from factory import (
+    ArrowLight,
+    EmergencyLight,
+    LightTypeID,
+    PedestrianLight,
+    TrafficLight,
+    TrafficLightFactory,
+    VehicleLight,
+)
+
+
+@pytest.fixture
+def registry():
+    """Restore the light type registry after a test adds to it."""
+    saved = dict(factory._LIGHT_REGISTRY)
+    yield factory._LIGHT_REGISTRY
+    factory._LIGHT_REGISTRY.clear()
+    factory._LIGHT_REGISTRY.update(saved)
+
+
+class TestTrafficLightFactory:
+    """Test light creation through the factory."""
+
+    @pytest.mark.parametrize("type_id, light_class", [
+        (LightTypeID.VEHICLE, VehicleLight),
+        (LightTypeID.PEDESTRIAN, PedestrianLight),
+        (LightTypeID.EMERGENCY, EmergencyLight),
+        (LightTypeID.ARROW, ArrowLight),
+    ])
+    def test_create_light_by_id(self, type_id, light_class):
+        """Verify each LightTypeID builds the matching class."""
+        light = TrafficLightFactory.create_light_by_id(type_id, "NORTH")
+
+        assert type(light) is light_class
+        assert light.direction == "NORTH"
+        assert type(light) is type(
+            TrafficLightFactory.create_light(type_id.name, "NORTH")
+        )
+
+    def test_subclass_with_light_name_is_registered(self, registry):
+        """Verify defining a light_name subclass registers it."""
+        class FlashingLight(TrafficLight, light_name="Flashing"):
+            def get_duration(self) -> int:
+                return 1
+
+            def get_sequence(self):
+                return ()
+
+        assert "flashing" in TrafficLightFactory.get_supported_types()
+        assert isinstance(TrafficLightFactory.create_light("FLASHING", "EAST"), FlashingLight)
+
+    def test_unknown_type_raises(self):
+        """Verify unknown light types are rejected."""
+        with pytest.raises(ValueError):
+            TrafficLightFactory.create_light("hovercraft", "NORTH")
@@ -0,0 +1,67 @@
+import logging
+
+import pytest
+
+from strategy import (
+    AdaptiveStrategy,
+    FixedTimeStrategy,
+    LightState,
+    SequencingStrategy,
+    TrafficLightContext,
+)
+
+
+class DuckTypedStrategy:
+    """Strategy written against get_sequence/get_duration only."""
+
+    def get_sequence(self):
+        return (LightState.GREEN, LightState.RED)
+
+    def get_duration(self, state):
+        return 10 if state is LightState.GREEN else 20
+
+
+class ExplicitStrategy(SequencingStrategy):
+    """Same strategy, subclassing the Protocol explicitly."""
+
+    def get_sequence(self):
+        return (LightState.GREEN, LightState.RED)
+
+    def get_duration(self, state):
+        return 10 if state is LightState.GREEN else 20
+
+
+def cycle_lines(strategy, caplog):
+    with caplog.at_level(logging.DEBUG, logger="strategy"):
+        TrafficLightContext(strategy).execute_cycle()
+    return [record.getMessage() for record in caplog.records]
+
+
+class TestTrafficLightContext:
+    """Test running strategies through the context."""
+
+    @pytest.mark.parametrize("strategy_class", [DuckTypedStrategy, ExplicitStrategy])
+    def test_strategy_without_plan_falls_back(self, strategy_class, caplog):
+        """Verify strategies without a plan still run via get_duration."""
+        assert cycle_lines(strategy_class(), caplog)[1:] == [
+            "   GREEN: 10s",
+            "   RED: 20s",
+        ]
+
+    def test_plan_matches_get_duration(self, caplog):
+        """Verify precomputed plans agree with the per-state durations."""
+        for strategy in (FixedTimeStrategy(), AdaptiveStrategy("heavy")):
+            assert strategy.plan == tuple(
+                (state, strategy.get_duration(state)) for state in strategy.get_sequence()
+            )
+        assert cycle_lines(FixedTimeStrategy(), caplog)[1:] == [
+            "   GREEN: 60s",
+            "   YELLOW: 5s",
+            "   RED: 65s",
+        ]
+
+    def test_adaptive_level_change_updates_plan(self):
+        """Verify changing traffic_level recomputes the plan."""
+        strategy = AdaptiveStrategy("light")
+        strategy.traffic_level = "heavy"
+        assert strategy.plan[0] == (LightState.GREEN, 90)
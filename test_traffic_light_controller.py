@@ -0,0 +1,220 @@
+import asyncio
+import threading
+
+import pytest
+
+from traffic_light_controller import (
+    AsyncTrafficLightController,
+    ConflictError,
+    Direction,
+    EventPublisher,
+    InMemoryRepository,
+    LightColor,
+    StateChange,
+    TrafficLightController,
+)
+
+
+class RecordingPublisher(EventPublisher):
+    """Collects published events instead of printing them."""
+
+    def __init__(self):
+        self.events = []
+
+    def publish(self, event: StateChange) -> None:
+        self.events.append(event)
+
+
+class RaisingPublisher(RecordingPublisher):
+    """Fails on every publish, counting flush calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.flushes = 0
+
+    def publish(self, event: StateChange) -> None:
+        raise OSError("event sink unavailable")
+
+    def flush(self) -> None:
+        self.flushes += 1
+
+
+@pytest.fixture
+def controller():
+    return TrafficLightController(InMemoryRepository(), RecordingPublisher())
+
+
+class TestTrafficLightController:
+    """Test the hexagonal traffic light controller."""
+
+    def test_execute_sequence_completes(self, controller):
+        """Verify execute_sequence does not deadlock on its own lock."""
+        worker = threading.Thread(target=controller.execute_sequence)
+        worker.start()
+        worker.join(timeout=5)
+
+        assert not worker.is_alive()
+        state = controller.get_current_state()
+        assert state[Direction.NORTH] == LightColor.RED
+        assert state[Direction.EAST] == LightColor.GREEN
+        assert state[Direction.WEST] == LightColor.GREEN
+
+    def test_conflicting_batch_leaves_lights_untouched(self, controller):
+        """Verify a batch with a conflict applies none of its changes."""
+        with controller._lock:
+            with pytest.raises(ConflictError):
+                controller._apply((
+                    (Direction.NORTH, LightColor.GREEN),
+                    (Direction.EAST, LightColor.GREEN),
+                ))
+
+        assert all(c == LightColor.RED for c in controller.get_current_state().values())
+        assert all(light.color == LightColor.RED for light in controller.lights)
+        assert controller.get_history() == []
+        assert controller.publisher.events == []
+
+    def test_history_order_and_filter(self, controller):
+        """Verify history is oldest first and filters by direction."""
+        controller.change_light(Direction.NORTH, LightColor.GREEN)
+        controller.change_light(Direction.SOUTH, LightColor.GREEN)
+        controller.change_light(Direction.NORTH, LightColor.YELLOW)
+
+        history = controller.get_history()
+        assert [(e.direction, e.color) for e in history] == [
+            (Direction.NORTH, LightColor.GREEN),
+            (Direction.SOUTH, LightColor.GREEN),
+            (Direction.NORTH, LightColor.YELLOW),
+        ]
+        assert [e.timestamp for e in history] == sorted(e.timestamp for e in history)
+
+        north = controller.get_history(Direction.NORTH)
+        assert [e.color for e in north] == [LightColor.GREEN, LightColor.YELLOW]
+        assert controller.get_history(Direction.EAST) == []
+
+    def test_raising_publisher_leaves_state_consistent(self):
+        """Verify a publisher error happens after state is saved, and still flushes."""
+        repository = InMemoryRepository()
+        publisher = RaisingPublisher()
+        controller = TrafficLightController(repository, publisher)
+
+        with pytest.raises(OSError):
+            controller.change_light(Direction.NORTH, LightColor.GREEN)
+        with pytest.raises(OSError):
+            controller.execute_sequence()
+
+        state = controller.get_current_state()
+        assert state == {light.direction: light.color for light in controller.lights}
+        assert state[Direction.EAST] == LightColor.GREEN
+        assert repository.load_state()[Direction.EAST].color == LightColor.GREEN
+        assert len(controller.get_history()) == 9
+        assert publisher.flushes == 2
+
+    def test_conflict_across_controllers_sharing_repository(self):
+        """Verify a change made by one controller is seen by another."""
+        repository = InMemoryRepository()
+        first = TrafficLightController(repository, RecordingPublisher())
+        first.change_light(Direction.SOUTH, LightColor.RED)
+        second = TrafficLightController(repository, RecordingPublisher())
+        second.change_light(Direction.NORTH, LightColor.GREEN)
+
+        assert first.get_current_state()[Direction.NORTH] == LightColor.GREEN
+        with pytest.raises(ConflictError):
+            first.change_light(Direction.EAST, LightColor.GREEN)
+
+
+class TestAsyncTrafficLightController:
+    """Test the asyncio front end."""
+
+    def test_conflict_propagates_to_caller(self, controller):
+        """Verify a ConflictError raised by the writer reaches the awaiting caller."""
+        async def scenario():
+            front = AsyncTrafficLightController(controller)
+            await front.start()
+            try:
+                await front.change_light(Direction.NORTH, LightColor.GREEN)
+                with pytest.raises(ConflictError):
+                    await front.change_light(Direction.EAST, LightColor.GREEN)
+            finally:
+                await front.stop()
+
+        asyncio.run(scenario())
+        assert controller.get_current_state()[Direction.EAST] == LightColor.RED
+
+    def test_writer_does_not_take_controller_lock(self, controller):
+        """Verify changes apply on the loop thread without the controller lock."""
+        async def scenario():
+            front = AsyncTrafficLightController(controller)
+            await front.start()
+            try:
+                with controller._lock:
+                    await asyncio.wait_for(
+                        front.change_light(Direction.NORTH, LightColor.GREEN), timeout=5
+                    )
+            finally:
+                await front.stop()
+
+        asyncio.run(scenario())
+        assert controller.get_current_state()[Direction.NORTH] == LightColor.GREEN
+
+    def test_start_twice_is_refused(self, controller):
+        """Verify a second start() raises instead of spawning another writer."""
+        async def scenario():
+            front = AsyncTrafficLightController(controller)
+            await front.start()
+            try:
+                with pytest.raises(RuntimeError):
+                    await front.start()
+            finally:
+                await front.stop()
+
+        asyncio.run(scenario())
+
+    def test_stop_fails_queued_and_later_changes(self, controller):
+        """Verify stop() resolves queued changes and refuses new ones."""
+        async def scenario():
+            front = AsyncTrafficLightController(controller)
+            await front.start()
+            tasks = [
+                asyncio.create_task(front.change_light(direction, LightColor.YELLOW))
+                for direction in (Direction.NORTH, Direction.SOUTH, Direction.EAST)
+            ]
+            await asyncio.sleep(0)  # let the changes reach the queue
+            await front.stop()
+
+            results = await asyncio.wait_for(
+                asyncio.gather(*tasks, return_exceptions=True), timeout=5
+            )
+            with pytest.raises(RuntimeError):
+                await front.change_light(Direction.WEST, LightColor.YELLOW)
+            return results
+
+        results = asyncio.run(scenario())
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert controller.get_history() == []
+
+    def test_cancelled_change_is_skipped(self, controller):
+        """Verify a change cancelled while queued is never applied."""
+        async def scenario():
+            front = AsyncTrafficLightController(controller)
+            await front.start()
+            try:
+                first = asyncio.create_task(
+                    front.change_light(Direction.NORTH, LightColor.GREEN)
+                )
+                second = asyncio.create_task(
+                    front.change_light(Direction.EAST, LightColor.YELLOW)
+                )
+                await asyncio.sleep(0)  # let both changes reach the queue
+                second.cancel()
+                await first
+                await front.change_light(Direction.SOUTH, LightColor.GREEN)
+            finally:
+                await front.stop()
+            return second
+
+        second = asyncio.run(scenario())
+        assert second.cancelled()
+        assert [e.direction for e in controller.get_history()] == [
+            Direction.NORTH, Direction.SOUTH,
+        ]
+        assert controller.get_current_state()[Direction.EAST] == LightColor.RED
@@ -10,11 +10,18 @@ Features:
 """
 
 from abc import ABC, abstractmethod
+from array import array
 from dataclasses import dataclass
-from datetime import datetime
 from enum import Enum
-from typing import List, Dict, Optional
+from typing import FrozenSet, List, Dict, Optional, Sequence, Tuple
+import asyncio
+import logging
+import sys
 import threading
+import time
+
+
+_log = logging.getLogger(__name__)
 
 
 # Domain Model
@@ -24,19 +31,37 @@ class Direction(Enum):
     EAST = "EAST"
     WEST = "WEST"
 
+    def __init__(self, value: str):
+        # Plain attribute copies, cheaper to read than .value; _idx is the
+        # member's position (members are added after __init__ runs)
+        self._label = value
+        self._idx = len(type(self)._member_names_)
+
 
 class LightColor(Enum):
     RED = "RED"
     YELLOW = "YELLOW"
     GREEN = "GREEN"
 
+    def __init__(self, value: str):
+        self._label = value
+        self._idx = len(type(self)._member_names_)
+
 
 @dataclass
 class StateChange:
     """Record of a state change."""
+    __slots__ = ("direction", "color", "timestamp")
+
     direction: Direction
     color: LightColor
-    timestamp: datetime
+    timestamp: int  # Nanoseconds since the epoch (time.time_ns())
+
+
+# Member._idx indexes these tuples, the controller's lights list and the
+# green bitmask (bit 1 << _idx); it is also what history arrays store.
+_DIRECTIONS = tuple(Direction)
+_COLORS = tuple(LightColor)
 
 
 class ConflictError(Exception):
@@ -48,37 +73,51 @@ class ConflictError(Exception):
 class TrafficLight:
     """Domain entity representing a single traffic light."""
 
+    __slots__ = ("direction", "color")
+
     def __init__(self, direction: Direction):
         self.direction = direction
         self.color = LightColor.RED
-        self.history: List[StateChange] = []
 
     def change_color(self, new_color: LightColor) -> None:
-        """Change light color and record in history."""
+        """Change light color."""
         self.color = new_color
-        change = StateChange(self.direction, new_color, datetime.now())
-        self.history.append(change)
 
 
 class ConflictValidator:
     """Domain service for validating traffic light conflicts."""
 
-    CONFLICTING_DIRECTIONS = {
-        Direction.NORTH: [Direction.EAST, Direction.WEST],
-        Direction.SOUTH: [Direction.EAST, Direction.WEST],
-        Direction.EAST: [Direction.NORTH, Direction.SOUTH],
-        Direction.WEST: [Direction.NORTH, Direction.SOUTH],
+    CONFLICTING_DIRECTIONS: Dict[Direction, FrozenSet[Direction]] = {
+        Direction.NORTH: frozenset({Direction.EAST, Direction.WEST}),
+        Direction.SOUTH: frozenset({Direction.EAST, Direction.WEST}),
+        Direction.EAST: frozenset({Direction.NORTH, Direction.SOUTH}),
+        Direction.WEST: frozenset({Direction.NORTH, Direction.SOUTH}),
     }
 
+    # Bitmask of the directions that conflict with each direction
+    CONFLICT_MASKS: Dict[Direction, int] = {
+        direction: sum(1 << d._idx for d in conflicts)
+        for direction, conflicts in CONFLICTING_DIRECTIONS.items()
+    }
+
+    @staticmethod
+    def green_mask(lights: Dict[Direction, TrafficLight]) -> int:
+        """Return the bitmask of directions currently green."""
+        mask = 0
+        for direction, light in lights.items():
+            if light.color is LightColor.GREEN:
+                mask |= 1 << direction._idx
+        return mask
+
     @classmethod
-    def would_conflict(cls, direction: Direction, 
-                      current_states: Dict[Direction, LightColor]) -> bool:
+    def would_conflict(cls, direction: Direction,
+                       lights: Dict[Direction, TrafficLight]) -> bool:
         """Check if setting direction to green would conflict."""
-        conflicts = cls.CONFLICTING_DIRECTIONS.get(direction, [])
-        return any(
-            current_states.get(conflict_dir) == LightColor.GREEN
-            for conflict_dir in conflicts
-        )
+        return bool(cls.green_mask(lights) & cls.CONFLICT_MASKS[direction])
+
+
+# CONFLICT_MASKS indexed by Direction._idx
+_CONFLICT_MASKS = tuple(ConflictValidator.CONFLICT_MASKS[d] for d in _DIRECTIONS)
 
 
 # Ports (Interfaces)
@@ -101,16 +140,25 @@ class EventPublisher(ABC):
     def publish(self, event: StateChange) -> None:
         pass
 
+    def flush(self) -> None:
+        """Deliver any buffered events (no-op for unbuffered adapters)."""
+
 
 # Adapters (Implementations)
 class InMemoryRepository(TrafficLightRepository):
-    """Adapter: In-memory storage."""
+    """
+    Adapter: In-memory storage.
+
+    Stores and returns the caller's dict by reference rather than copying
+    it; the controller mutates its lights in place, so there is nothing
+    to snapshot.
+    """
 
     def __init__(self):
         self._storage: Dict[Direction, TrafficLight] = {}
 
     def save_state(self, lights: Dict[Direction, TrafficLight]) -> None:
-        self._storage = lights.copy()
+        self._storage = lights
 
     def load_state(self) -> Dict[Direction, TrafficLight]:
         if not self._storage:
@@ -119,15 +167,37 @@ class InMemoryRepository(TrafficLightRepository):
                 direction: TrafficLight(direction)
                 for direction in Direction
             }
-        return self._storage.copy()
+        return self._storage
 
 
 class ConsoleEventPublisher(EventPublisher):
-    """Adapter: Console output for events."""
+    """
+    Adapter: Console output for events.
+
+    Events are buffered and written to stdout in one call by flush(),
+    which the controller invokes after releasing its lock.
+    """
+
+    def __init__(self):
+        self._pending: List[str] = []
+        self._pending_lock = threading.Lock()
 
     def publish(self, event: StateChange) -> None:
-        timestamp = event.timestamp.strftime("%H:%M:%S")
-        print(f"[{timestamp}] {event.direction.value}: {event.color.value}")
+        # Fixed HH:MM:SS format: read the fields directly, no strftime
+        t = time.localtime(event.timestamp // 1_000_000_000)
+        line = (
+            f"[{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}] "
+            f"{event.direction._label}: {event.color._label}\n"
+        )
+        with self._pending_lock:
+            self._pending.append(line)
+
+    def flush(self) -> None:
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        if pending:
+            sys.stdout.write("".join(pending))
+            sys.stdout.flush()
 
 
 # Application Service (Use Cases)
@@ -143,94 +213,239 @@ class TrafficLightController:
                  publisher: EventPublisher):
         self.repository = repository
         self.publisher = publisher
-        self.lights = repository.load_state()
+        # The repository port deals in a dict; the controller indexes a list
+        # by Direction._idx. Both hold the same TrafficLight objects.
+        self._lights_by_direction = repository.load_state()
+        self.lights: List[TrafficLight] = [
+            self._lights_by_direction[direction] for direction in _DIRECTIONS
+        ]
         self._lock = threading.Lock()
         self._paused = False
+        # History as parallel columns in global append order
+        self._hist_dir = array('b')
+        self._hist_col = array('b')
+        self._hist_ts = array('q')
 
-    def change_light(self, direction: Direction, color: LightColor) -> None:
+    def _apply(self, transitions: Sequence[Tuple[Direction, LightColor]]) -> None:
         """
-        Change a traffic light color.
+        Apply a batch of light changes. Caller must hold the lock.
 
-        Validates conflicts and publishes events.
-        Thread-safe.
+        The whole batch is validated before any light changes, so a
+        conflict leaves the lights untouched. State is saved once per
+        batch.
         """
-        with self._lock:
-            if self._paused:
-                raise RuntimeError("Controller is paused")
-
-            # Validate no conflicts if changing to green
-            if color == LightColor.GREEN:
-                current_states = {d: light.color for d, light in self.lights.items()}
-                if ConflictValidator.would_conflict(direction, current_states):
+        if self._paused:
+            raise RuntimeError("Controller is paused")
+
+        # Build the green mask from the lights themselves rather than
+        # caching it: they may be shared with other controllers via the
+        # repository, so no cached copy can be trusted
+        mask = ConflictValidator.green_mask(self._lights_by_direction)
+
+        # Validate no conflicts if changing to green
+        for direction, color in transitions:
+            idx = direction._idx
+            if color is LightColor.GREEN:
+                if mask & _CONFLICT_MASKS[idx]:
                     conflicting = [
-                        d.value for d, c in current_states.items()
-                        if d != direction and c == LightColor.GREEN
+                        d.value for d in _DIRECTIONS
+                        if d is not direction and mask & (1 << d._idx)
                     ]
                     raise ConflictError(
                         f"Cannot set {direction.value} to GREEN: "
                         f"conflicts with {conflicting}"
                     )
+                mask |= 1 << idx
+            else:
+                mask &= ~(1 << idx)
 
+        events = []
+        for direction, color in transitions:
             # Change light
-            light = self.lights[direction]
-            light.change_color(color)
+            self.lights[direction._idx].change_color(color)
+
+            # Record history
+            timestamp = time.time_ns()
+            self._hist_dir.append(direction._idx)
+            self._hist_col.append(color._idx)
+            self._hist_ts.append(timestamp)
+            events.append(StateChange(direction, color, timestamp))
 
-            # Publish event
-            self.publisher.publish(light.history[-1])
+        # Save state before publishing, so a raising publisher cannot
+        # leave the lights changed but unsaved
+        self.repository.save_state(self._lights_by_direction)
 
-            # Save state
-            self.repository.save_state(self.lights)
+        # Publish events
+        for event in events:
+            self.publisher.publish(event)
+
+    def change_light(self, direction: Direction, color: LightColor) -> None:
+        """
+        Change a traffic light color.
+
+        Validates conflicts and publishes events.
+        Thread-safe.
+        """
+        try:
+            with self._lock:
+                self._apply(((direction, color),))
+        finally:
+            # Output happens outside the lock
+            self.publisher.flush()
 
     def get_current_state(self) -> Dict[Direction, LightColor]:
-        """Get current state of all lights."""
+        """
+        Get current state of all lights.
+
+        Reads the lights themselves rather than a cached copy: they may
+        be shared with other controllers through the repository.
+        """
         with self._lock:
-            return {direction: light.color for direction, light in self.lights.items()}
+            return {light.direction: light.color for light in self.lights}
 
     def get_history(self, direction: Optional[Direction] = None) -> List[StateChange]:
-        """Get history of state changes."""
+        """Get history of state changes, oldest first."""
+        # Only the column copies need the lock; filtering and building
+        # StateChange records happen after it is released.
         with self._lock:
-            if direction:
-                return self.lights[direction].history.copy()
-            else:
-                all_history = []
-                for light in self.lights.values():
-                    all_history.extend(light.history)
-                return sorted(all_history, key=lambda x: x.timestamp)
+            dirs = self._hist_dir[:]
+            cols = self._hist_col[:]
+            stamps = self._hist_ts[:]
+
+        rows = zip(dirs, cols, stamps)
+        if direction is not None:
+            code = direction._idx
+            rows = (row for row in rows if row[0] == code)
+        return [
+            StateChange(_DIRECTIONS[d], _COLORS[c], ts)
+            for d, c, ts in rows
+        ]
 
     def pause(self) -> None:
         """Pause the controller."""
         with self._lock:
             self._paused = True
-            print("⏸️  Controller paused")
+            _log.info("⏸️  Controller paused")
 
     def resume(self) -> None:
         """Resume the controller."""
         with self._lock:
             self._paused = False
-            print("▶️  Controller resumed")
+            _log.info("▶️  Controller resumed")
 
     def execute_sequence(self) -> None:
-        """Execute a standard traffic sequence."""
-        with self._lock:
-            print("\n🔄 Executing sequence...")
+        """Execute a standard traffic sequence as one atomic batch."""
+        try:
+            with self._lock:
+                _log.debug("🔄 Executing sequence...")
+                self._apply((
+                    # North-South green
+                    (Direction.NORTH, LightColor.GREEN),
+                    (Direction.SOUTH, LightColor.GREEN),
+                    # Change to yellow
+                    (Direction.NORTH, LightColor.YELLOW),
+                    (Direction.SOUTH, LightColor.YELLOW),
+                    # Change to red
+                    (Direction.NORTH, LightColor.RED),
+                    (Direction.SOUTH, LightColor.RED),
+                    # East-West green
+                    (Direction.EAST, LightColor.GREEN),
+                    (Direction.WEST, LightColor.GREEN),
+                ))
+        finally:
+            # Flush events first so they print before the completion line
+            self.publisher.flush()
+        _log.debug("✅ Sequence complete")
+
+
+class AsyncTrafficLightController:
+    """
+    Asyncio front end for TrafficLightController.
+
+    Changes are queued to a single writer task on the event loop thread,
+    which applies them through the controller's _apply without taking
+    its lock: being the only writer is what serialises them. While the
+    front end is started it therefore owns the controller's writes; do
+    not change lights through the sync API at the same time. Each run of
+    queued changes is followed by one publisher flush.
+    """
+
+    def __init__(self, controller: TrafficLightController):
+        self._controller = controller
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start the writer task on the running event loop."""
+        if self._writer is not None:
+            raise RuntimeError("Controller is already started")
+        self._queue = asyncio.Queue()
+        self._writer = asyncio.create_task(self._writer_loop(self._queue))
 
-            # North-South green
-            self.change_light(Direction.NORTH, LightColor.GREEN)
-            self.change_light(Direction.SOUTH, LightColor.GREEN)
+    async def stop(self) -> None:
+        """
+        Stop the writer task.
 
-            # Change to yellow
-            self.change_light(Direction.NORTH, LightColor.YELLOW)
-            self.change_light(Direction.SOUTH, LightColor.YELLOW)
+        Changes still queued fail with RuntimeError, as do calls made
+        after stop().
+        """
+        if self._writer is None:
+            return
+        queue, self._queue = self._queue, None
+        self._writer.cancel()
+        try:
+            await self._writer
+        except asyncio.CancelledError:
+            pass
+        self._writer = None
+
+        while not queue.empty():
+            _, _, future = queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Controller stopped"))
+
+    async def change_light(self, direction: Direction, color: LightColor) -> None:
+        """
+        Change a traffic light color via the writer task.
 
-            # Change to red
-            self.change_light(Direction.NORTH, LightColor.RED)
-            self.change_light(Direction.SOUTH, LightColor.RED)
+        Raises whatever the controller raises (ConflictError, RuntimeError).
+        """
+        if self._queue is None:
+            raise RuntimeError("Controller is not started")
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((direction, color, future))
+        await future
+
+    async def _writer_loop(self, queue: asyncio.Queue) -> None:
+        controller = self._controller
+        while True:
+            item = await queue.get()
+            # Apply everything already queued, then flush once
+            while True:
+                direction, color, future = item
+                if not future.cancelled():
+                    try:
+                        controller._apply(((direction, color),))
+                    except Exception as e:
+                        future.set_exception(e)
+                    else:
+                        future.set_result(None)
+                if queue.empty():
+                    break
+                item = queue.get_nowait()
+            try:
+                controller.publisher.flush()
+            except Exception:
+                # The changes were applied; keep the writer alive
+                _log.exception("Event publisher flush failed")
 
-            # East-West green
-            self.change_light(Direction.EAST, LightColor.GREEN)
-            self.change_light(Direction.WEST, LightColor.GREEN)
+    def get_current_state(self) -> Dict[Direction, LightColor]:
+        """Get current state of all lights."""
+        return self._controller.get_current_state()
 
-            print("✅ Sequence complete")
+    def get_history(self, direction: Optional[Direction] = None) -> List[StateChange]:
+        """Get history of state changes, oldest first."""
+        return self._controller.get_history(direction)
 
 
 def demonstrate_traffic_controller():
@@ -266,4 +481,6 @@ def demonstrate_traffic_controller():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s",
+                        stream=sys.stdout)
     demonstrate_traffic_controller()